@@ -4,197 +4,286 @@ Household Finance Calculator
 Run: python calc.py [--update-rates]
 """
 
-import json
+try:
+    import simdjson  # SIMD structural parse with lazy key access
+except ImportError:
+    simdjson = None
+    try:
+        import orjson as _json  # ~3x faster parse; falls back to stdlib
+    except ImportError:
+        import json as _json
 import csv
+import io
+import pickle
 import sys
-from datetime import datetime
+from collections import defaultdict, namedtuple
+from datetime import date
+from operator import itemgetter
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).parent
+CACHE_DIR  = SCRIPT_DIR / ".cache"
 
 def load_json(filename):
-    with open(SCRIPT_DIR / filename) as f:
-        return json.load(f)
+    src = SCRIPT_DIR / filename
+    cached = CACHE_DIR / (filename + ".pkl")
+
+    # Pickle-load beats re-parsing JSON; keyed on source mtime
+    try:
+        if cached.stat().st_mtime >= src.stat().st_mtime:
+            with open(cached, 'rb') as f:
+                return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass  # no/stale/corrupt cache → parse from source
+
+    with open(src, 'rb') as f:  # fast parsers want bytes
+        data = f.read()
+    if simdjson is not None:
+        # Lazy Document: only keys we actually touch cross into Python.
+        # One Parser per document — a recycled parser would invalidate
+        # the accounts Document when income.json is parsed.
+        parsed = simdjson.Parser().parse(data)
+        plain  = parsed.as_dict()  # Documents don't pickle
+    else:
+        parsed = plain = _json.loads(data)
+
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        with open(cached, 'wb') as f:
+            pickle.dump(plain, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # cache is best-effort
+    return parsed
+
+# Compact row record: no per-row dict, attribute access is a C slot read
+Row = namedtuple('Row', 'date description amount currency category type')
 
 def load_expenses():
-    expenses = []
     csv_path = SCRIPT_DIR / "expenses.csv"
-    if csv_path.exists():
-        with open(csv_path) as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                row['amount'] = float(row['amount'])
-                expenses.append(row)
+    if not csv_path.exists():
+        return []
+    # One slab read, then parse from memory; csv.reader + positional
+    # indexing skips the per-row dict a DictReader would allocate.
+    # Placeholder rows never reach the bucketing loop.
+    reader = csv.reader(io.StringIO(csv_path.read_text()))
+    header = next(reader, [])
+    idx = {name: i for i, name in enumerate(header)}
+    i_date, i_desc, i_amt, i_cur, i_cat = (
+        idx[c] for c in ('date', 'description', 'amount', 'currency', 'category'))
+    i_typ = idx.get('type')  # absent in the pre-type file format
+
+    expenses = []
+    for row in reader:
+        if not row:
+            continue  # blank line
+        if row[i_desc].startswith('Example:'):
+            continue
+        # Hand-appended rows may use the short README format with no
+        # type column even when the header has one
+        typ = row[i_typ] if i_typ is not None and len(row) > i_typ else 'monthly'
+        expenses.append(Row(row[i_date], row[i_desc], float(row[i_amt]),
+                            row[i_cur], row[i_cat], typ))
     return expenses
 
-def to_usd(amount, currency, rates):
-    if currency == "USD":
-        return amount
-    elif currency == "RUB":
-        return amount / rates["RUB_USD"]
-    elif currency == "GEL":
-        return amount / rates["GEL_USD"]
-    elif currency == "EUR":
-        return amount * rates.get("EUR_USD", 1.08)
-    elif currency == "GBP":
-        return amount * rates.get("GBP_USD", 1.27)
-    else:
-        raise ValueError(f"Unknown currency: {currency}")
+def make_to_usd(mult):
+    """Specialize a converter for one rates snapshot.
+
+    The multiplier lookup is bound as a default arg so each call runs on
+    locals only — the per-run constants are baked in once, the closest
+    safe analog of codegen'ing a per-snapshot function.
+    """
+    def to_usd(amount, currency, _get=mult.get):
+        m = _get(currency)
+        if m is None:
+            raise ValueError(f"Unknown currency: {currency}")
+        return amount * m
+    return to_usd
 
-def fmt_usd(amount):
-    return f"${amount:,.0f}"
+def usd_multipliers(rates):
+    """Currency → USD multiplier table, reciprocals precomputed once."""
+    return {
+        "USD": 1.0,
+        "RUB": 1.0 / rates["RUB_USD"],
+        "GEL": 1.0 / rates["GEL_USD"],
+        "EUR": rates["EUR_USD"] if "EUR_USD" in rates else 1.08,
+        "GBP": rates["GBP_USD"] if "GBP_USD" in rates else 1.27,
+    }
 
-def fmt_num(amount):
-    return f"{amount:,.0f}"
+def bucket_expenses(expenses, to_usd):
+    """One pass over the rows → (monthly_cat, yearly_items, oneoff_cat) USD totals.
 
-def print_section(title):
-    print(f"\n{'='*50}")
-    print(f" {title}")
-    print('='*50)
+    Only the amount/currency/type/category columns are touched here;
+    rendering happens separately in main().
+    """
+    # One fused accumulator: (type, key) → total USD; one keyed += per
+    # row instead of three separate dicts behind a storage branch
+    totals = defaultdict(float)
+
+    for exp in expenses:
+        typ = exp.type
+        if typ == 'yearly':
+            key = exp.description
+        else:
+            if typ != 'oneoff':
+                typ = 'monthly'  # anything unrecognized counts as monthly
+            key = exp.category
+        # Through the shared converter: a typo'd currency in the
+        # hand-edited CSV gets the "Unknown currency" ValueError, not a
+        # bare KeyError
+        totals[typ, key] += to_usd(exp.amount, exp.currency)
+
+    # Split into the three display maps afterward
+    monthly_cat, yearly_items, oneoff_cat = {}, {}, {}
+    buckets = {'monthly': monthly_cat, 'yearly': yearly_items, 'oneoff': oneoff_cat}
+    for (typ, key), usd_val in totals.items():
+        buckets[typ][key] = usd_val
+
+    return monthly_cat, yearly_items, oneoff_cat
+
+# Bound format methods: the spec is parsed once, not per call
+fmt_usd = "${:,.0f}".format
+fmt_num = "{:,.0f}".format
+
+def section_header(title):
+    return f"\n{'='*50}\n {title}\n{'='*50}"
 
 def main():
     accounts_data = load_json("accounts.json")
     income_data = load_json("income.json")
     expenses = load_expenses()
+
+    out = []   # buffer the whole report; one write() at the end
+    w = out.append
     
     rates = accounts_data["rates"]
+    mult  = usd_multipliers(rates)
+    to_usd = make_to_usd(mult)
+    rub_rate = rates["RUB_USD"]
+    gel_rate = rates["GEL_USD"]
     
     # ========== NET WORTH ==========
-    print_section("NET WORTH")
-    print(f"As of: {accounts_data['updated']}")
-    print(f"Rates: 1 USD = {rates['RUB_USD']} RUB | {rates['GEL_USD']} GEL")
+    w(section_header("NET WORTH"))
+    w(f"As of: {accounts_data['updated']}")
+    w(f"Rates: 1 USD = {rub_rate} RUB | {gel_rate} GEL")
     
     # Bank accounts
-    print("\n📊 Bank Accounts:")
-    bank_total_usd = 0
-    for acc in accounts_data["accounts"]:
-        usd_val = to_usd(acc["balance"], acc["currency"], rates)
-        bank_total_usd += usd_val
+    w("\n📊 Bank Accounts:")
+    accounts = accounts_data["accounts"]
+    acc_usd  = [to_usd(a["balance"], a["currency"]) for a in accounts]
+    bank_total_usd = sum(acc_usd)  # C-level accumulator
+    for acc, usd_val in zip(accounts, acc_usd):
         if acc["balance"] > 0:
-            print(f"  {acc['name']}: {fmt_num(acc['balance'])} {acc['currency']} ({fmt_usd(usd_val)})")
-    print(f"  ─────────────────────────────")
-    print(f"  Bank Total: {fmt_usd(bank_total_usd)}")
+            w(f"  {acc['name']}: {fmt_num(acc['balance'])} {acc['currency']} ({fmt_usd(usd_val)})")
+    w(f"  ─────────────────────────────")
+    w(f"  Bank Total: {fmt_usd(bank_total_usd)}")
     
     # Assets
-    print("\n🏠 Assets:")
-    assets_total_usd = 0
-    for asset in accounts_data["assets"]:
-        usd_val = to_usd(asset["value"], asset["currency"], rates)
-        assets_total_usd += usd_val
-        note = f" ({asset.get('note', '')})" if asset.get('note') else ""
-        print(f"  {asset['name']}: {fmt_num(asset['value'])} {asset['currency']} ({fmt_usd(usd_val)}){note}")
-    print(f"  ─────────────────────────────")
-    print(f"  Assets Total: {fmt_usd(assets_total_usd)}")
+    w("\n🏠 Assets:")
+    assets = accounts_data["assets"]
+    asset_usd = [to_usd(a["value"], a["currency"]) for a in assets]
+    assets_total_usd = sum(asset_usd)
+    for asset, usd_val in zip(assets, asset_usd):
+        note = f" ({asset['note']})" if "note" in asset and asset["note"] else ""
+        w(f"  {asset['name']}: {fmt_num(asset['value'])} {asset['currency']} ({fmt_usd(usd_val)}){note}")
+    w(f"  ─────────────────────────────")
+    w(f"  Assets Total: {fmt_usd(assets_total_usd)}")
     
     # Passive income assets
-    print("\n📈 Passive Income:")
+    w("\n📈 Passive Income:")
     for item in accounts_data["passive_income"]:
-        monthly_usd = to_usd(item["monthly"], item["currency"], rates)
-        print(f"  {item['name']}: {fmt_num(item['monthly'])} {item['currency']}/mo ({fmt_usd(monthly_usd)}/mo)")
+        monthly_usd = to_usd(item["monthly"], item["currency"])
+        w(f"  {item['name']}: {fmt_num(item['monthly'])} {item['currency']}/mo ({fmt_usd(monthly_usd)}/mo)")
     
     # Total
     total_net_worth = bank_total_usd + assets_total_usd
-    print(f"\n💰 TOTAL NET WORTH: {fmt_usd(total_net_worth)}")
+    w(f"\n💰 TOTAL NET WORTH: {fmt_usd(total_net_worth)}")
     
     # ========== MONTHLY CASH FLOW ==========
-    print_section("MONTHLY CASH FLOW")
+    w(section_header("MONTHLY CASH FLOW"))
     
     # Income
-    print("\n📥 Income:")
-    income_total_usd = 0
-    for inc in income_data["monthly_income"]:
-        usd_val = to_usd(inc["amount"], inc["currency"], rates)
-        income_total_usd += usd_val
+    w("\n📥 Income:")
+    incomes = income_data["monthly_income"]
+    inc_usd = [to_usd(i["amount"], i["currency"]) for i in incomes]
+    income_total_usd = sum(inc_usd)
+    for inc, usd_val in zip(incomes, inc_usd):
         if inc["amount"] > 0:
-            print(f"  {inc['source']}: {fmt_num(inc['amount'])} {inc['currency']} ({fmt_usd(usd_val)})")
+            w(f"  {inc['source']}: {fmt_num(inc['amount'])} {inc['currency']} ({fmt_usd(usd_val)})")
         else:
-            note = inc.get('note', 'TBD')
-            print(f"  {inc['source']}: {note}")
-    print(f"  ─────────────────────────────")
-    print(f"  Income Total: {fmt_usd(income_total_usd)}/month")
+            note = inc['note'] if 'note' in inc else 'TBD'
+            w(f"  {inc['source']}: {note}")
+    w(f"  ─────────────────────────────")
+    w(f"  Income Total: {fmt_usd(income_total_usd)}/month")
     
     # Fixed expenses
-    print("\n📤 Fixed Expenses:")
-    expenses_total_usd = 0
-    for exp in income_data["fixed_expenses"]:
-        usd_val = to_usd(exp["amount"], exp["currency"], rates)
-        expenses_total_usd += usd_val
-        print(f"  {exp['item']}: {fmt_num(exp['amount'])} {exp['currency']} ({fmt_usd(usd_val)})")
-    print(f"  ─────────────────────────────")
-    print(f"  Fixed Total: {fmt_usd(expenses_total_usd)}/month")
+    w("\n📤 Fixed Expenses:")
+    fixed = income_data["fixed_expenses"]
+    fixed_usd = [to_usd(e["amount"], e["currency"]) for e in fixed]
+    expenses_total_usd = sum(fixed_usd)
+    for exp, usd_val in zip(fixed, fixed_usd):
+        w(f"  {exp['item']}: {fmt_num(exp['amount'])} {exp['currency']} ({fmt_usd(usd_val)})")
+    w(f"  ─────────────────────────────")
+    w(f"  Fixed Total: {fmt_usd(expenses_total_usd)}/month")
     
     # Available
     available_usd = income_total_usd - expenses_total_usd
-    available_gel = available_usd * rates["GEL_USD"]
-    print(f"\n💵 Available for Living:")
-    print(f"  {fmt_usd(available_usd)}/month")
-    print(f"  {fmt_num(available_gel)} GEL/month")
+    available_gel = available_usd * gel_rate
+    w(f"\n💵 Available for Living:")
+    w(f"  {fmt_usd(available_usd)}/month")
+    w(f"  {fmt_num(available_gel)} GEL/month")
     
     # ========== EXPENSE TRACKING ==========
     if len(expenses) > 1:
-        print_section("EXPENSE TRACKING")
+        w(section_header("EXPENSE TRACKING"))
 
         # Date range
-        dates = [datetime.strptime(e['date'], '%Y-%m-%d') for e in expenses]
+        dates = [date.fromisoformat(e.date) for e in expenses]  # C fast path, no strptime
         start, end = min(dates), max(dates)
         weeks  = max((end - start).days / 7.0, 1)
         months = weeks / 4.33
 
         # Bucket expenses
-        monthly_cat = {}   # category → total USD
-        yearly_items = {}  # description → total USD
-        oneoff_cat  = {}   # category → total USD
-
-        for exp in expenses:
-            usd_val = to_usd(exp['amount'], exp['currency'], rates)
-            cat  = exp['category']
-            typ  = exp.get('type', 'monthly')
-
-            if typ == 'yearly':
-                yearly_items[exp['description']] = yearly_items.get(exp['description'], 0) + usd_val
-            elif typ == 'oneoff':
-                oneoff_cat[cat] = oneoff_cat.get(cat, 0) + usd_val
-            else:  # monthly
-                monthly_cat[cat] = monthly_cat.get(cat, 0) + usd_val
+        monthly_cat, yearly_items, oneoff_cat = bucket_expenses(expenses, to_usd)
 
-        print(f"\nPeriod: {start.strftime('%b %d')} – {end.strftime('%b %d')} ({weeks:.1f} weeks)")
+        w(f"\nPeriod: {start.strftime('%b %d')} – {end.strftime('%b %d')} ({weeks:.1f} weeks)")
 
         # 🔄 Monthly baseline (normalized to per-month)
         monthly_total = sum(monthly_cat.values())
         monthly_per_mo = monthly_total / months
-        print(f"\n🔄 MONTHLY (per month, normalized):")
-        for cat, total in sorted(monthly_cat.items(), key=lambda x: -x[1]):
-            print(f"  {cat:16s} {fmt_usd(total / months):>8s}/mo")
-        print(f"  ─────────────────────────────")
-        print(f"  {'Baseline':16s} {fmt_usd(monthly_per_mo):>8s}/mo")
+        w(f"\n🔄 MONTHLY (per month, normalized):")
+        for cat, total in sorted(monthly_cat.items(), key=itemgetter(1), reverse=True):
+            w(f"  {cat:16s} {fmt_usd(total / months):>8s}/mo")
+        w(f"  ─────────────────────────────")
+        w(f"  {'Baseline':16s} {fmt_usd(monthly_per_mo):>8s}/mo")
 
         # 📅 Yearly (amortized /12)
         yearly_per_mo = 0
         if yearly_items:
-            print(f"\n📅 YEARLY (amortized /12):")
-            for desc, total in sorted(yearly_items.items(), key=lambda x: -x[1]):
+            w(f"\n📅 YEARLY (amortized /12):")
+            for desc, total in sorted(yearly_items.items(), key=itemgetter(1), reverse=True):
                 per_mo = total / 12
                 yearly_per_mo += per_mo
-                print(f"  {desc:30s} {fmt_usd(per_mo):>6s}/mo  (paid: {fmt_usd(total)})")
-            print(f"  ─────────────────────────────")
-            print(f"  {'Yearly total':30s} {fmt_usd(yearly_per_mo):>6s}/mo")
+                w(f"  {desc:30s} {fmt_usd(per_mo):>6s}/mo  (paid: {fmt_usd(total)})")
+            w(f"  ─────────────────────────────")
+            w(f"  {'Yearly total':30s} {fmt_usd(yearly_per_mo):>6s}/mo")
 
         # 🎄 One-off
         oneoff_total = sum(oneoff_cat.values())
         oneoff_per_mo = oneoff_total / months if months > 0 else 0
         if oneoff_cat:
-            print(f"\n🎄 ONE-OFF (this period):")
-            for cat, total in sorted(oneoff_cat.items(), key=lambda x: -x[1]):
-                print(f"  {cat:16s} {fmt_usd(total)}")
-            print(f"  ─────────────────────────────")
-            print(f"  {'Total':16s} {fmt_usd(oneoff_total)}  (avg {fmt_usd(oneoff_per_mo)}/mo)")
+            w(f"\n🎄 ONE-OFF (this period):")
+            for cat, total in sorted(oneoff_cat.items(), key=itemgetter(1), reverse=True):
+                w(f"  {cat:16s} {fmt_usd(total)}")
+            w(f"  ─────────────────────────────")
+            w(f"  {'Total':16s} {fmt_usd(oneoff_total)}  (avg {fmt_usd(oneoff_per_mo)}/mo)")
 
         # 📊 Normalized monthly
         normalized = monthly_per_mo + yearly_per_mo + oneoff_per_mo
-        print(f"\n📊 NORMALIZED MONTHLY: {fmt_usd(normalized)}/mo")
-        print(f"   baseline {fmt_usd(monthly_per_mo)} + yearly {fmt_usd(yearly_per_mo)} + one-off avg {fmt_usd(oneoff_per_mo)}")
+        w(f"\n📊 NORMALIZED MONTHLY: {fmt_usd(normalized)}/mo")
+        w(f"   baseline {fmt_usd(monthly_per_mo)} + yearly {fmt_usd(yearly_per_mo)} + one-off avg {fmt_usd(oneoff_per_mo)}")
     
-    print("\n" + "="*50)
+    w("\n" + "="*50)
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     main()
@@ -9,9 +9,15 @@ Commands:
 Categories: Food, Transport, Utilities, Entertainment, Health, Kid, Pets, Clothes, Home, Other, Rent, Cash
 """
 
+try:
+    import orjson  # C JSON codec, ~5x faster; flagged/learned files grow unbounded
+except ImportError:
+    orjson = None
 import csv, json, re, sys, hashlib
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
 
 # ─── Paths ───────────────────────────────────────────────────────────────────
 SCRIPT_DIR    = Path(__file__).parent
@@ -24,6 +30,8 @@ VALID_CATEGORIES = [
     "Food","Transport","Utilities","Entertainment",
     "Health","Kid","Pets","Clothes","Home","Other","Rent","Cash",
 ]
+# Case-insensitive lookup for approve args, folded once at import
+_CAT_BY_LOWER = {c.lower(): c for c in VALID_CATEGORIES}
 
 # ─── Type tagging (monthly / yearly / oneoff) ────────────────────────────────
 TYPE_CAT_DEFAULTS = {
@@ -114,96 +122,147 @@ MERCHANT_KW = {
     "Other": ["temu", "ozon", "vape room"],
 }
 
+# One combined keyword matcher: a single C-level scan of the merchant
+# name instead of ~50 Python substring probes per row. Keyword → category
+# map built from MERCHANT_KW; the leftmost hit in the name wins (ties at
+# the same position fall back to category declaration order).
+_KW_CAT = {kw: cat for cat, kws in MERCHANT_KW.items() for kw in kws}
+_KW_RE  = re.compile("|".join(re.escape(kw) for kw in _KW_CAT))
+
 # Known transfer beneficiaries → auto-category
 KNOWN_BENEFICIARIES = {
     "dalakishvili ana": "Rent",
 }
 
 # ─── Helpers ─────────────────────────────────────────────────────────────────
+_EU_AMOUNT_TABLE = str.maketrans({" ": None, "\xa0": None, ",": "."})
+
+@lru_cache(maxsize=None)
+def _cvt_date(s):
+    """'dd/mm/yyyy' → 'yyyy-mm-dd'. Memoized — a statement has at most
+    ~31 distinct dates, so this collapses N strptime/strftime pairs."""
+    return f"{s[6:10]}-{s[3:5]}-{s[0:2]}"
+
 def parse_eu_amount(s):
     """European format: '1 234,5' → 1234.5"""
     if not s or not s.strip():
         return 0.0
-    return float(s.strip().replace(" ", "").replace("\xa0", "").replace(",", "."))
+    # One translate pass instead of three replace() allocations
+    return float(s.translate(_EU_AMOUNT_TABLE))
 
 def dedup_key(date_str, details):
+    # md5 stays: existing .dedup_keys/flagged entries use this format,
+    # and a faster hash would have to be computed alongside it forever
     return hashlib.md5(f"{date_str}|{details}".encode()).hexdigest()[:14]
 
 def load_json(path, default=None):
     try:
+        if orjson is not None:
+            return orjson.loads(path.read_bytes())
         return json.loads(path.read_text())
     except:
         return default if default is not None else {}
 
 def save_json(path, data):
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False))
+    # orjson writes UTF-8 natively, so no ensure_ascii escaping needed
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(data, indent=2, ensure_ascii=False))
 
 def load_dedup():
+    # Tolerates blank lines, so keys can simply be appended as they come
     try:
-        return set(line for line in DEDUP_PATH.read_text().strip().split("\n") if line)
+        return set(DEDUP_PATH.read_text().split("\n")) - {""}
     except:
         return set()
 
-def save_dedup(keys):
-    DEDUP_PATH.write_text("\n".join(sorted(keys)))
-
 # ─── Extraction ──────────────────────────────────────────────────────────────
-def extract_charged(details):
-    """'Payment transaction amount and currency: 24.12 GEL' → (24.12, 'GEL')"""
-    m = re.search(r"Payment transaction amount and currency:\s*([\d.,]+)\s*([A-Z]{3})", details)
-    if m:
-        return float(m.group(1).replace(",", "")), m.group(2)
+# Every known detail field in one combined pattern; a single finditer
+# pass replaces the half-dozen per-field re.search scans of the same
+# ~300-char string. Compiled once at import.
+_RE_DETAILS = re.compile(
+    r"Payment transaction amount and currency:\s*(?P<ch_amt>[\d.,]+)\s*(?P<ch_cur>[A-Z]{3})"
+    r"|Amount:?\s*(?P<l_cur>[A-Z]{3})\s*(?P<l_amt>[\d.,]+)"
+    r"|Merchant:\s*(?P<merchant>[^;]+)"
+    r"|MCC:(?P<mcc>\d+)"
+    r"|Date:\s*(?P<date>\d{2}/\d{2}/\d{4})"
+    r"|ATM:\s*(?P<atm>[^;]+)"
+    r"|Beneficiary:\s*(?P<benef>[^;]+)"
+    # Lookahead: capture the note without consuming it, so fields that
+    # appear after "Details:" are still scanned
+    r"|Details:\s*(?=(?P<note>.+))"
+)
+_RE_ROW_DATE = re.compile(r"\d{2}/\d{2}/\d{4}")
+
+def scan_details(details):
+    """Extract every known field from a details string in one pass.
+
+    Returns {group name: raw capture}; the first occurrence of a field
+    wins, matching the old one-regex-per-field extractors.
+    """
+    fields = {}
+    for m in _RE_DETAILS.finditer(details):
+        for k, v in m.groupdict().items():
+            if v is not None and k not in fields:
+                fields[k] = v
+    return fields
+
+def scanned_amount(sc):
+    """(amount, currency) from a scan — the exact charged amount is
+    preferred over the leading 'Amount:' field; (None, None) if neither
+    parses to something non-zero."""
+    if "ch_amt" in sc:
+        amt = float(sc["ch_amt"].replace(",", ""))
+        if amt:
+            return amt, sc["ch_cur"]
+    if "l_amt" in sc:
+        amt = float(sc["l_amt"].replace(",", ""))
+        if amt:
+            return amt, sc["l_cur"]
     return None, None
 
-def extract_leading(details):
-    """'Amount: GEL59.49' or 'Amount GEL59.49' → (59.49, 'GEL')"""
-    m = re.search(r"Amount:?\s*([A-Z]{3})\s*([\d.,]+)", details)
-    if m:
-        return float(m.group(2).replace(",", "")), m.group(1)
-    return None, None
-
-def extract_merchant_mcc_date(details):
-    merchant = mcc = actual_date = None
-    m = re.search(r"Merchant:\s*([^;]+)", details)
-    if m: merchant = m.group(1).strip()
-    m = re.search(r"MCC:(\d+)", details)
-    if m: mcc = m.group(1)
-    m = re.search(r"Date:\s*(\d{2}/\d{2}/\d{4})", details)
-    if m: actual_date = m.group(1)
-    return merchant, mcc, actual_date
-
-def extract_atm(details):
-    m = re.search(r"ATM:\s*([^;]+)", details)
-    return m.group(1).strip() if m else "ATM"
+# ─── Categorization ──────────────────────────────────────────────────────────
+# Known service patterns: one fused scan yields both the category and the
+# cleaned-up description, shared by categorize and fix_description.
+_RE_SPECIAL = re.compile(
+    r"(?P<pen>traffic penalty)|(?P<ener>tbilisienergy)"
+    r"|(?P<ep>ep georgia supply)|(?P<bus>tbilisi bus)",
+    re.IGNORECASE,
+)
+_SPECIAL = {  # group name → (category, fixed description)
+    "pen":  ("Other", "Traffic Penalty"),
+    "ener": ("Utilities", "TbilisiEnergy (electricity)"),
+    "ep":   ("Utilities", "EP Georgia Supply (utilities)"),
+    "bus":  ("Transport", "Tbilisi Bus"),
+}
 
-def extract_beneficiary(details):
-    m = re.search(r"Beneficiary:\s*([^;]+)", details)
-    return m.group(1).strip() if m else "?"
+@lru_cache(maxsize=None)
+def match_special(text):
+    """(category, fixed description) for known service patterns, else None.
 
-def extract_transfer_note(details):
-    m = re.search(r"Details:\s*(.+)", details)
-    return m.group(1).strip() if m else ""
+    Cached because each payment's details string hits this twice: once at
+    parse time (fix_description) and once at categorize time."""
+    m = _RE_SPECIAL.search(text)
+    return _SPECIAL[m.lastgroup] if m else None
 
-# ─── Categorization ──────────────────────────────────────────────────────────
-def categorize(merchant, mcc, details, learned_map):
-    """Returns (category, is_auto)."""
+def categorize(merchant, ml, mcc, details, learned_map):
+    """Returns (category, is_auto). `ml` is merchant.lower(), folded once
+    by the caller; `learned_map` keys are pre-lowercased at load."""
     # 1. Learned map (from previous approvals)
-    if merchant and merchant.lower() in learned_map:
-        return learned_map[merchant.lower()], True
+    if ml and ml in learned_map:
+        return learned_map[ml], True
 
     # 2. Special detail patterns
-    dl = details.lower()
-    if "traffic penalty" in dl:        return "Other", True
-    if "tbilisienergy" in dl:          return "Utilities", True
-    if "ep georgia supply" in dl:      return "Utilities", True
-    if "tbilisi bus" in dl:            return "Transport", True
-
-    # 3. Merchant keyword match
-    if merchant:
-        ml = merchant.lower()
-        for cat, kws in MERCHANT_KW.items():
-            if any(kw in ml for kw in kws):
-                return cat, True
+    sp = match_special(details)
+    if sp:
+        return sp[0], True
+
+    # 3. Merchant keyword match (one pass over the name)
+    if ml:
+        m = _KW_RE.search(ml)
+        if m:
+            return _KW_CAT[m.group(0)], True
 
     # 4. MCC code
     if mcc and mcc in MCC_CAT:
@@ -213,149 +272,170 @@ def categorize(merchant, mcc, details, learned_map):
 
 def fix_description(desc, details):
     """Clean up description for known service patterns."""
-    dl = details.lower()
-    if "traffic penalty" in dl:        return "Traffic Penalty"
-    if "tbilisienergy" in dl:          return "TbilisiEnergy (electricity)"
-    if "ep georgia supply" in dl:      return "EP Georgia Supply (utilities)"
-    if "tbilisi bus" in dl:            return "Tbilisi Bus"
-    return desc
+    sp = match_special(details)
+    return sp[1] if sp else desc
 
 # ─── Core parser ─────────────────────────────────────────────────────────────
+@dataclass(slots=True)
+class Tx:
+    """One parsed transaction; slots keep it compact vs a per-row dict."""
+    date: str
+    description: str
+    amount: float
+    currency: str
+    category: str = None
+    flag: str = None
+    dk: str = ""
+    merchant: str = None
+    mcc: str = None
+
+
+# Internal / non-expense rows to ignore entirely — one pass, no lower()
+_RE_SKIP = re.compile(
+    r"automatic conversion|zolotayakorona|interest payment|points exchange"
+    r"|point redemption|foreign exchange|incoming transfer|credit funds",
+    re.IGNORECASE,
+)
+
 def should_skip(details):
     """Internal / non-expense rows to ignore entirely."""
-    dl = details.lower()
-    return any(tag in dl for tag in [
-        "automatic conversion", "zolotayakorona",
-        "interest payment", "points exchange", "point redemption",
-        "foreign exchange", "incoming transfer", "credit funds",
-    ])
+    return _RE_SKIP.search(details) is not None
+
+# Row-kind dispatch: one dict probe on the first 7 chars instead of
+# three startswith scans per row. 7 chars tell the kinds apart ("Payment"
+# in full); the longer two prefixes get confirmed inside the loop, since
+# "Withdrawal:" runs straight into punctuation rather than a space.
+_PREFIX = {"Payment": "payment", "Withdra": "cash", "Outgoin": "transfer"}
 
 def parse_bog(filepath):
-    """Parse BoG CSV → list of transaction dicts."""
+    """Parse BoG CSV → list of Tx records."""
     txs = []
-    lines = Path(filepath).read_text(encoding="utf-8-sig").strip().split("\n")
-
-    for line in lines[1:]:  # skip header
-        if not line.strip():
-            continue
-        row = next(csv.reader([line]), None)
-        if not row or len(row) < 2:
-            continue
+    append = txs.append  # bound once; skips the attribute lookup per row
+    with open(filepath, encoding="utf-8-sig", newline="", buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        next(reader, None)  # skip header
+
+        for row in reader:
+            if len(row) < 2:
+                continue
+
+            date_raw = row[0].strip()
+            details  = row[1].strip()
+
+            # Skip non-date rows (Balance, empty, etc.)
+            if not _RE_ROW_DATE.match(date_raw):
+                continue
+            # Skip internal transactions
+            if should_skip(details):
+                continue
+
+            kind = _PREFIX.get(details[:7])
+            if kind is None:
+                continue
+            if kind == "cash" and not details.startswith("Withdrawal"):
+                continue
+            if kind == "transfer" and not details.startswith("Outgoing Transfer"):
+                continue
+
+            # Column amounts (European format)
+            gel = parse_eu_amount(row[3]) if len(row) > 3 else 0
+            usd = parse_eu_amount(row[4]) if len(row) > 4 else 0
+            eur = parse_eu_amount(row[5]) if len(row) > 5 else 0
+            gbp = parse_eu_amount(row[6]) if len(row) > 6 else 0
+
+            tx_date = _cvt_date(date_raw)
+            dk = dedup_key(date_raw, details)
+
+            # ── ATM Withdrawal → flag as cash ────────────────────────────────────
+            if kind == "cash":
+                sc = scan_details(details)
+                amt, cur = scanned_amount(sc)
+                if not amt:
+                    amt, cur = (abs(gel), "GEL") if gel < 0 else (0, "GEL")
+                if "date" in sc:
+                    tx_date = _cvt_date(sc["date"])
+
+                append(Tx(
+                    date=tx_date,
+                    description=f"Cash (ATM: {sc.get('atm', 'ATM').strip()})",
+                    amount=amt, currency=cur,
+                    flag="cash", dk=dk,
+                ))
+                continue
+
+            # ── Outgoing Transfer → flag unless known ────────────────────────────
+            if kind == "transfer":
+                sc          = scan_details(details)
+                beneficiary = sc.get("benef", "?").strip()
+                note        = sc.get("note", "").strip()
+                amt, cur    = scanned_amount(sc)
+                if not amt:
+                    if   usd < 0: amt, cur = abs(usd), "USD"
+                    elif gel < 0: amt, cur = abs(gel), "GEL"
+                    elif eur < 0: amt, cur = abs(eur), "EUR"
+                    else: continue
+
+                cat, flag = None, "transfer"
+                for known, known_cat in KNOWN_BENEFICIARIES.items():
+                    if known in beneficiary.lower():
+                        cat, flag = known_cat, None
+                        break
+
+                append(Tx(
+                    date=tx_date,
+                    description=f"→ {beneficiary}" + (f" ({note})" if note else ""),
+                    amount=amt, currency=cur,
+                    category=cat, flag=flag, dk=dk,
+                ))
+                continue
+
+            # ── Regular Payment ──────────────────────────────────────────────────
+            if kind == "payment":
+                sc = scan_details(details)
+                amt, cur = scanned_amount(sc)
+                if not amt:
+                    if   gel < 0: amt, cur = abs(gel), "GEL"
+                    elif usd < 0: amt, cur = abs(usd), "USD"
+                    elif eur < 0: amt, cur = abs(eur), "EUR"
+                    elif gbp < 0: amt, cur = abs(gbp), "GBP"
+                    else: continue
+
+                merchant = sc["merchant"].strip() if "merchant" in sc else None
+                mcc      = sc.get("mcc")
+                if "date" in sc:
+                    tx_date = _cvt_date(sc["date"])
+
+                description = merchant if merchant else details[:60]
+                description = fix_description(description, details)
+
+                append(Tx(
+                    date=tx_date,
+                    description=description,
+                    amount=amt, currency=cur,
+                    dk=dk, merchant=merchant, mcc=mcc,
+                ))
+                continue
 
-        date_raw = row[0].strip()
-        details  = row[1].strip()
-
-        # Skip non-date rows (Balance, empty, etc.)
-        if not re.match(r"\d{2}/\d{2}/\d{4}", date_raw):
-            continue
-        # Skip internal transactions
-        if should_skip(details):
-            continue
-
-        # Column amounts (European format)
-        gel = parse_eu_amount(row[3]) if len(row) > 3 else 0
-        usd = parse_eu_amount(row[4]) if len(row) > 4 else 0
-        eur = parse_eu_amount(row[5]) if len(row) > 5 else 0
-        gbp = parse_eu_amount(row[6]) if len(row) > 6 else 0
-
-        date_obj = datetime.strptime(date_raw, "%d/%m/%Y")
-        dk = dedup_key(date_raw, details)
-
-        # ── ATM Withdrawal → flag as cash ────────────────────────────────────
-        if details.startswith("Withdrawal"):
-            amt, cur = extract_charged(details)
-            if not amt:
-                amt, cur = extract_leading(details)
-            if not amt:
-                amt, cur = (abs(gel), "GEL") if gel < 0 else (0, "GEL")
-            _, _, act_date = extract_merchant_mcc_date(details)
-            if act_date:
-                date_obj = datetime.strptime(act_date, "%d/%m/%Y")
-
-            txs.append(dict(
-                date=date_obj.strftime("%Y-%m-%d"),
-                description=f"Cash (ATM: {extract_atm(details)})",
-                amount=amt, currency=cur,
-                category=None, flag="cash", dk=dk,
-            ))
-            continue
-
-        # ── Outgoing Transfer → flag unless known ────────────────────────────
-        if details.startswith("Outgoing Transfer"):
-            beneficiary = extract_beneficiary(details)
-            note        = extract_transfer_note(details)
-            amt, cur    = extract_leading(details)
-            if not amt:
-                if   usd < 0: amt, cur = abs(usd), "USD"
-                elif gel < 0: amt, cur = abs(gel), "GEL"
-                elif eur < 0: amt, cur = abs(eur), "EUR"
-                else: continue
-
-            cat, flag = None, "transfer"
-            for known, known_cat in KNOWN_BENEFICIARIES.items():
-                if known in beneficiary.lower():
-                    cat, flag = known_cat, None
-                    break
-
-            txs.append(dict(
-                date=date_obj.strftime("%Y-%m-%d"),
-                description=f"→ {beneficiary}" + (f" ({note})" if note else ""),
-                amount=amt, currency=cur,
-                category=cat, flag=flag, dk=dk,
-                merchant=None,
-            ))
-            continue
-
-        # ── Regular Payment ──────────────────────────────────────────────────
-        if details.startswith("Payment"):
-            # Amount: prefer exact "Payment transaction amount and currency"
-            amt, cur = extract_charged(details)
-            if not amt:
-                amt, cur = extract_leading(details)
-            if not amt:
-                if   gel < 0: amt, cur = abs(gel), "GEL"
-                elif usd < 0: amt, cur = abs(usd), "USD"
-                elif eur < 0: amt, cur = abs(eur), "EUR"
-                elif gbp < 0: amt, cur = abs(gbp), "GBP"
-                else: continue
-
-            merchant, mcc, act_date = extract_merchant_mcc_date(details)
-            if act_date:
-                date_obj = datetime.strptime(act_date, "%d/%m/%Y")
-
-            description = merchant if merchant else details[:60]
-            description = fix_description(description, details)
-
-            txs.append(dict(
-                date=date_obj.strftime("%Y-%m-%d"),
-                description=description,
-                amount=amt, currency=cur,
-                category=None, flag=None, dk=dk,
-                merchant=merchant, mcc=mcc,
-            ))
-            continue
 
     return txs
 
 # ─── Commands ────────────────────────────────────────────────────────────────
 def cmd_parse(filepath):
-    learned   = load_json(MERCHANT_MAP, {})
+    # Fold map keys once so no case conversion happens per lookup
+    learned   = {k.lower(): v for k, v in load_json(MERCHANT_MAP, {}).items()}
     known_dks = load_dedup()
 
     print(f"📂 Parsing {filepath}…")
     txs = parse_bog(filepath)
     print(f"   {len(txs)} transactions found")
 
-    # Dedup
-    new_txs, dupes = [], 0
-    for t in txs:
-        if t["dk"] in known_dks:
-            dupes += 1
-        else:
-            new_txs.append(t)
-    if dupes:
-        print(f"   ⏭️  {dupes} duplicate(s) skipped")
-    txs = new_txs
+    # Dedup: one C-level set intersection instead of per-row membership
+    # tests against the (growing) known-key set
+    dupe_set = known_dks.intersection(t.dk for t in txs)
+    if dupe_set:
+        kept = [t for t in txs if t.dk not in dupe_set]
+        print(f"   ⏭️  {len(txs) - len(kept)} duplicate(s) skipped")
+        txs = kept
 
     if not txs:
         print("   Nothing new.")
@@ -363,28 +443,28 @@ def cmd_parse(filepath):
 
     # Categorize payments
     for t in txs:
-        if t.get("flag") in ("cash", "transfer"):
+        if t.flag in ("cash", "transfer"):
             continue  # already typed — will be flagged
-        if t.get("category") is not None:
+        if t.category is not None:
             continue  # already categorized (e.g. known beneficiary)
+        merchant = t.merchant
         cat, is_auto = categorize(
-            t.get("merchant"), t.get("mcc"),
-            t.get("description", ""), learned
+            merchant, merchant.lower() if merchant else None,
+            t.mcc, t.description, learned
         )
-        t["category"] = cat
-        t["flag"]     = None if is_auto else "unknown"
+        t.category = cat
+        t.flag     = None if is_auto else "unknown"
 
     # Split
-    auto    = [t for t in txs if not t.get("flag")]
-    flagged = [t for t in txs if  t.get("flag")]
+    auto    = [t for t in txs if not t.flag]
+    flagged = [t for t in txs if  t.flag]
 
     # ── Print summary ────────────────────────────────────────────────────────
     print(f"\n✅ Auto-categorized: {len(auto)}")
     if auto:
-        totals = {}
+        totals = defaultdict(float)
         for t in auto:
-            k = (t["category"], t["currency"])
-            totals[k] = totals.get(k, 0) + t["amount"]
+            totals[t.category, t.currency] += t.amount
         for (cat, cur), total in sorted(totals.items()):
             print(f"     {cat:16s} {total:>10.2f} {cur}")
 
@@ -393,12 +473,13 @@ def cmd_parse(filepath):
     if not isinstance(existing_flagged, list):
         existing_flagged = []
     existing_dks = {item["dk"] for item in existing_flagged}
+    n_flagged_before = len(existing_flagged)
     for t in flagged:
-        if t["dk"] not in existing_dks:
+        if t.dk not in existing_dks:
             existing_flagged.append(dict(
-                dk=t["dk"], date=t["date"], description=t["description"],
-                amount=t["amount"], currency=t["currency"],
-                flag=t["flag"], merchant=t.get("merchant"),
+                dk=t.dk, date=t.date, description=t.description,
+                amount=t.amount, currency=t.currency,
+                flag=t.flag, merchant=t.merchant,
             ))
 
     print(f"\n❓ Flagged for review: {len(existing_flagged)}")
@@ -409,31 +490,39 @@ def cmd_parse(filepath):
 
     # ── Save auto → expenses.csv ─────────────────────────────────────────────
     if auto:
-        # If file only has example data, reset it
+        # If file only has example data, reset it. Template detection
+        # needs only the first lines, not an O(file) read: ≤2 real lines
+        # with an Example row.
         if EXPENSES_PATH.exists():
-            existing_lines = EXPENSES_PATH.read_text().strip().split("\n")
-            if len(existing_lines) <= 2 and any("Example" in l for l in existing_lines):
+            with EXPENSES_PATH.open() as f:
+                head  = [f.readline() for _ in range(3)]
+                small = not head[2].strip() and not f.readline()
+            if small and any("Example" in l for l in head):
                 EXPENSES_PATH.write_text("date,description,amount,currency,category,type\n")
         else:
             EXPENSES_PATH.write_text("date,description,amount,currency,category,type\n")
 
-        with open(EXPENSES_PATH, "a", newline="") as f:
-            w = csv.writer(f)
-            for t in sorted(auto, key=lambda x: x["date"]):
-                typ = assign_type(t["description"], t["category"])
-                w.writerow([t["date"], t["description"],
-                            round(t["amount"], 2), t["currency"], t["category"], typ])
+        # In-place sort: statements are chronological already, so TimSort
+        # takes its near-sorted fast path and no second list is built
+        auto.sort(key=lambda x: x.date)
+        with open(EXPENSES_PATH, "a", newline="", buffering=1 << 20) as f:
+            csv.writer(f).writerows(
+                (t.date, t.description, round(t.amount, 2), t.currency,
+                 t.category, assign_type(t.description, t.category))
+                for t in auto)
         print(f"\n💾 {len(auto)} expenses saved")
 
-    # ── Save flagged ─────────────────────────────────────────────────────────
-    save_json(FLAGGED_PATH, existing_flagged)
+    # ── Save flagged (only when the merge actually added something) ──────────
+    if len(existing_flagged) != n_flagged_before:
+        save_json(FLAGGED_PATH, existing_flagged)
     if flagged:
         print(f"💾 {len(flagged)} new item(s) flagged")
 
-    # ── Update dedup keys ────────────────────────────────────────────────────
-    for t in txs:
-        known_dks.add(t["dk"])
-    save_dedup(known_dks)
+    # ── Update dedup keys: append the new ones, don't rewrite history ────────
+    new_keys = {t.dk for t in txs} - known_dks
+    if new_keys:
+        with open(DEDUP_PATH, "a") as f:
+            f.write("".join("\n" + k for k in new_keys))
 
     print(f"\n💡 To approve flagged: python3 finance/parse_bog.py approve 1=Food 2=skip …")
 
@@ -484,7 +573,7 @@ def cmd_approve(args):
             continue
 
         # Case-insensitive category match
-        matched = next((c for c in VALID_CATEGORIES if c.lower() == cat.lower()), None)
+        matched = _CAT_BY_LOWER.get(cat.lower())
         if not matched:
             print(f"⚠️  Unknown category '{cat}'. Valid: {', '.join(VALID_CATEGORIES)}")
             continue